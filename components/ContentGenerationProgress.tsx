@@ -409,7 +409,7 @@ export const ContentGenerationProgress: React.FC<ContentGenerationProgressProps>
       {/* Overall Progress */}
       <div className="mb-4">
         <div className="flex justify-between text-sm mb-1 text-gray-300">
-          <span>Pass {job.current_pass} of 10: {currentPassName}</span>
+          <span data-testid="pass-indicator">Pass {job.current_pass} of 10: {currentPassName}</span>
           <span>{progress}%</span>
         </div>
         <div className="w-full bg-gray-700 rounded-full h-2">
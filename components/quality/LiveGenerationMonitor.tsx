@@ -404,7 +404,7 @@ export const LiveGenerationMonitor: React.FC<LiveGenerationMonitorProps> = ({
         {/* Progress indicator */}
         <div className="space-y-2">
           <div className="flex items-center justify-between text-sm">
-            <span className="text-gray-400">
+            <span className="text-gray-400" data-testid="pass-indicator">
               Pass {Math.min(currentPass, totalPasses)} of {totalPasses}
             </span>
             <span className="text-gray-400">
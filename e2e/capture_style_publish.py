@@ -16,9 +16,11 @@ Usage:
     python e2e/capture_style_publish.py
 """
 
+import re
 import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeout
+from typing import Sequence
+from playwright.sync_api import sync_playwright, expect, Page, TimeoutError as PlaywrightTimeout
 
 # Configuration
 BASE_URL = "http://localhost:3000"
@@ -33,13 +35,74 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 SCREENSHOT_DIR = SCRIPT_DIR / "screenshots"
 SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
 
-
-def screenshot(page: Page, name: str, full_page: bool = True) -> str:
-    """Take a screenshot and return the file path."""
-    filepath = str(SCREENSHOT_DIR / name)
-    page.screenshot(path=filepath, full_page=full_page)
+# Logged-in storage state (Supabase session in localStorage), reused across runs
+AUTH_STATE = SCRIPT_DIR / ".auth" / "state.json"
+
+# Any of these means the Style & Publish wizard has rendered
+STYLE_UI_SELECTORS = (
+    'text=Brand Intelligence',
+    'text=Brand',
+    'text=Style & Publish',
+    'button:has-text("Next")',
+    'text=Layout Intelligence',
+    'text=Preview',
+)
+QUALITY_SELECTORS = (
+    'text=Brand Match',
+    'text=Quality',
+    'text=Brand Alignment',
+    '[class*="quality"]',
+    '[class*="score"]',
+)
+
+# Headless launch flags: no GPU, background services or shared-memory limits.
+# Images stay enabled since the screenshots are the output.
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--mute-audio",
+]
+
+# Don't wait for CSS animations to settle or capture the text caret
+SCREENSHOT_OPTS = {"animations": "disabled", "caret": "hide"}
+
+# Resolves once images in the viewport have loaded or failed (capped at
+# `timeout` ms, since lazy images outside the viewport never start loading)
+IMAGES_LOADED_JS = """(el, timeout) => {
+    const win = el.ownerDocument.defaultView;
+    const pending = Array.from(el.ownerDocument.images).filter(img => {
+        if (img.complete) return false;
+        const rect = img.getBoundingClientRect();
+        return rect.bottom > 0 && rect.top < win.innerHeight;
+    });
+    const loaded = Promise.all(pending.map(img => new Promise(resolve => {
+        img.addEventListener('load', resolve, { once: true });
+        img.addEventListener('error', resolve, { once: true });
+    })));
+    return Promise.race([loaded, new Promise(resolve => setTimeout(resolve, timeout))]);
+}"""
+
+# Button that starts rendering the preview
+GENERATE_NAME = re.compile("Generate|Render|Build Preview", re.I)
+
+
+def screenshot(page: Page, name: str, full_page: bool = False) -> str:
+    """Take a screenshot and return the file path.
+
+    The write is skipped when the file on disk already holds identical bytes.
+    """
+    filepath = SCREENSHOT_DIR / name
+    data = page.screenshot(full_page=full_page, **SCREENSHOT_OPTS)
+    if filepath.exists() and filepath.read_bytes() == data:
+        print(f"  [SCREENSHOT] {name} unchanged")
+        return str(filepath)
+    filepath.write_bytes(data)
     print(f"  [SCREENSHOT] {name}")
-    return filepath
+    return str(filepath)
 
 
 def wait_for_network_idle(page: Page, timeout: int = 10000):
@@ -50,6 +113,18 @@ def wait_for_network_idle(page: Page, timeout: int = 10000):
         pass
 
 
+def any_of(page: Page, selectors: Sequence[str]):
+    """Combine selectors (CSS or text=) into one locator matching any visible one.
+
+    Hidden matches are filtered out so `.first` can't land on a hidden node
+    that happens to come earlier in the DOM.
+    """
+    locator = page.locator(selectors[0])
+    for sel in selectors[1:]:
+        locator = locator.or_(page.locator(sel))
+    return locator.filter(visible=True)
+
+
 def client_side_navigate(page: Page, path: str):
     """Use React Router's client-side navigation to avoid full page reload.
     This preserves the React state (projects, maps, etc.)."""
@@ -60,29 +135,70 @@ def client_side_navigate(page: Page, path: str):
     }}""")
 
 
-def wait_for_url_contains(page: Page, substring: str, timeout: int = 15000):
+def wait_for_url_contains(page: Page, substring: str, timeout: int = 15000) -> bool:
     """Wait until the current URL contains a substring."""
-    start = time.time()
-    while time.time() - start < timeout / 1000:
-        if substring in page.url:
-            return True
-        page.wait_for_timeout(500)
+    try:
+        page.wait_for_url(lambda url: substring in url, timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+def wait_visible(locator, timeout: int = 5000) -> bool:
+    """Wait for a locator to become visible; return False on timeout."""
+    try:
+        locator.wait_for(state="visible", timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+def wait_for_style_ui(page: Page, timeout: int = 15000) -> bool:
+    """Wait until the Style & Publish UI renders on the style route.
+
+    The URL is already on /style right after navigating, so it is no signal by
+    itself. Returns False on timeout, or as soon as the app redirects away.
+    """
+    ui = any_of(page, STYLE_UI_SELECTORS).first
+    deadline = time.monotonic() + timeout / 1000
+    while time.monotonic() < deadline:
+        if "style" not in page.url:
+            return False
+        if wait_visible(ui, timeout=500):
+            return "style" in page.url
     return False
 
 
+def wait_for_images(locator, timeout: int = 5000):
+    """Wait for the images in view of the locator's document to finish loading."""
+    locator.evaluate(IMAGES_LOADED_JS, timeout)
+
+
+def wait_for_iframe_content(page: Page, timeout: int = 10000) -> bool:
+    """Wait until the first iframe's document has rendered body content."""
+    try:
+        page.frame_locator("iframe").first.locator("body > *").first.wait_for(timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
 def main():
     print("=" * 60)
     print("Style & Publish Screenshot Capture")
     print("=" * 60)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
         context = browser.new_context(
             viewport={"width": 1440, "height": 900},
-            device_scale_factor=2,
+            device_scale_factor=1,
+            storage_state=str(AUTH_STATE) if AUTH_STATE.exists() else None,
         )
+        # Fail fast on missing elements; explicit timeouts cover the slow steps
+        context.set_default_timeout(10000)
+        context.set_default_navigation_timeout(15000)
         page = context.new_page()
-        page.set_default_timeout(30000)
 
         errors = []
         page.on("pageerror", lambda err: errors.append(str(err)))
@@ -92,10 +208,9 @@ def main():
         # -------------------------------------------------------
         print("\n[Step 1] Logging in...")
         page.goto(BASE_URL, wait_until="domcontentloaded")
-        wait_for_network_idle(page, timeout=15000)
 
         try:
-            page.wait_for_selector('input[type="email"]', timeout=15000)
+            page.wait_for_selector('input[type="email"], table tbody tr', timeout=15000)
         except PlaywrightTimeout:
             print("  No login form found, may already be authenticated")
 
@@ -110,11 +225,13 @@ def main():
                 page.wait_for_url("**/projects**", timeout=15000)
                 print("  Redirected to projects page")
             except PlaywrightTimeout:
-                page.wait_for_timeout(3000)
+                wait_visible(page.locator('table tbody tr').first, timeout=3000)
                 print(f"  Current URL after login: {page.url}")
 
             wait_for_network_idle(page)
-            print("  Login complete")
+            AUTH_STATE.parent.mkdir(parents=True, exist_ok=True)
+            context.storage_state(path=str(AUTH_STATE))
+            print("  Login complete (session saved)")
         else:
             print("  Already logged in")
 
@@ -135,18 +252,14 @@ def main():
                 print("  WARNING: Projects did not load")
                 screenshot(page, "00-diagnostic.png")
 
-        wait_for_network_idle(page, timeout=10000)
-        page.wait_for_timeout(2000)
-
         # Find and click the NFIR project Open button
         nfir_row = page.locator('tr', has_text='NFIR').first
-        if not nfir_row.is_visible(timeout=3000):
+        if not wait_visible(nfir_row, timeout=3000):
             nfir_row = page.locator('tr', has_text='nfir').first
 
-        if nfir_row.is_visible(timeout=5000):
+        if wait_visible(nfir_row, timeout=5000):
             print("  Found NFIR project, clicking Open...")
-            nfir_row.locator('button:has-text("Open")').click()
-            page.wait_for_timeout(3000)
+            nfir_row.get_by_role("button", name="Open").click()
             wait_for_network_idle(page, timeout=15000)
             print(f"  URL: {page.url}")
         else:
@@ -157,31 +270,27 @@ def main():
         # -------------------------------------------------------
         print("\n[Step 3] Loading the map...")
 
-        # Wait for map selection page to appear
-        page.wait_for_timeout(2000)
-
-        # Look for Load Map button
-        load_btn = page.locator('button:has-text("Load Map")').first
-        if load_btn.is_visible(timeout=10000):
+        # Look for Load Map button once the map selection page appears
+        load_btn = page.get_by_role("button", name="Load Map").first
+        if wait_visible(load_btn, timeout=10000):
             print("  Found Load Map button, clicking...")
             load_btn.click()
-            page.wait_for_timeout(5000)
+            wait_for_url_contains(page, "/m/", timeout=5000)
             wait_for_network_idle(page, timeout=20000)
             print(f"  URL: {page.url}")
         else:
             # Might auto-load or have a different button
-            open_btn = page.locator('button:has-text("Open")').first
-            if open_btn.is_visible(timeout=5000):
+            open_btn = page.get_by_role("button", name="Open").first
+            if wait_visible(open_btn, timeout=5000):
                 print("  Found Open button, clicking...")
                 open_btn.click()
-                page.wait_for_timeout(5000)
+                wait_for_url_contains(page, "/m/", timeout=5000)
                 wait_for_network_idle(page, timeout=20000)
                 print(f"  URL: {page.url}")
             else:
                 print("  No Load Map button found, map may auto-load")
 
         # Wait for the dashboard/map content to be fully loaded
-        page.wait_for_timeout(5000)
         wait_for_network_idle(page, timeout=10000)
 
         # -------------------------------------------------------
@@ -193,8 +302,7 @@ def main():
 
         # Use client-side navigation to preserve React state
         client_side_navigate(page, TARGET_PATH)
-        page.wait_for_timeout(5000)
-        wait_for_network_idle(page, timeout=15000)
+        wait_for_style_ui(page, timeout=15000)
 
         current_url = page.url
         print(f"  URL after navigation: {current_url}")
@@ -215,7 +323,7 @@ def main():
                 link.click();
                 document.body.removeChild(link);
             }}""")
-            page.wait_for_timeout(5000)
+            wait_for_style_ui(page, timeout=5000)
             current_url = page.url
             print(f"  URL after link click approach: {current_url}")
 
@@ -228,10 +336,10 @@ def main():
                 print("  We're on the map/dashboard page. Good.")
                 # We need to find the topic in the topics table
                 # Search for the topic or scroll to find it
-                page.wait_for_timeout(2000)
+                topic_rows = page.locator('table tbody tr')
+                wait_visible(topic_rows.first, timeout=5000)
 
                 # Look for a topic table or list
-                topic_rows = page.locator('table tbody tr')
                 topic_count = topic_rows.count()
                 print(f"  Found {topic_count} topic rows in dashboard")
 
@@ -239,25 +347,22 @@ def main():
                     # Try to find our topic or click the first one
                     # Since we don't know the topic name, we need to search or browse
                     # Let's try clicking on the topic row
-                    for i in range(min(topic_count, 20)):
-                        row = topic_rows.nth(i)
-                        try:
-                            row_text = row.inner_text(timeout=2000)
-                            # Click the row to see the topic details
-                            if "kwetsbaar" in row_text.lower() or "cyber" in row_text.lower():
-                                print(f"  Found target topic in row {i}: {row_text[:60]}...")
-                                row.click()
-                                page.wait_for_timeout(2000)
-                                break
-                        except Exception:
-                            continue
+                    # Read the first 20 row texts in one round-trip
+                    row_texts = topic_rows.evaluate_all(
+                        "(rows) => rows.slice(0, 20).map(r => r.innerText)")
+                    for i, row_text in enumerate(row_texts):
+                        # Click the row to see the topic details
+                        if "kwetsbaar" in row_text.lower() or "cyber" in row_text.lower():
+                            print(f"  Found target topic in row {i}: {row_text[:60]}...")
+                            topic_rows.nth(i).click()
+                            break
 
                     # After clicking a topic, we might see a detail view with action buttons
                     # Look for style/publish option
-                    style_btn = page.locator('button:has-text("Style"), a:has-text("Style")')
-                    if style_btn.first.is_visible(timeout=5000):
+                    style_btn = page.get_by_role("button", name="Style").or_(page.get_by_role("link", name="Style"))
+                    if wait_visible(style_btn.first, timeout=5000):
                         style_btn.first.click()
-                        page.wait_for_timeout(3000)
+                        wait_for_url_contains(page, "style", timeout=3000)
                         print(f"  Clicked Style button. URL: {page.url}")
 
         # Final check: try full page navigation as last resort
@@ -266,20 +371,25 @@ def main():
         if "style" not in page.url:
             print("  Last resort: full page navigation with extended wait...")
             page.goto(BASE_URL + TARGET_PATH, wait_until="domcontentloaded")
-            # Wait a long time for the entire data cascade
-            page.wait_for_timeout(15000)
-            wait_for_network_idle(page, timeout=20000)
+            # Wait for the entire data cascade (up to 15s)
+            wait_for_style_ui(page, timeout=15000)
 
             # The app may redirect during loading, keep checking
             for attempt in range(5):
-                page.wait_for_timeout(3000)
-                if "style" in page.url:
+                if wait_for_style_ui(page, timeout=3000):
                     break
                 if "projects" in page.url and "/p/" not in page.url:
                     # Still on projects page, the auth/project data is loading
-                    page.wait_for_timeout(5000)
+                    wait_for_network_idle(page, timeout=5000)
                     page.goto(BASE_URL + TARGET_PATH, wait_until="domcontentloaded")
-                    page.wait_for_timeout(10000)
+                    wait_for_style_ui(page, timeout=10000)
+                elif "style" not in page.url:
+                    # Redirected elsewhere mid-load; let the route settle before re-checking
+                    url = page.url
+                    try:
+                        page.wait_for_url(lambda u: u != url, timeout=3000)
+                    except PlaywrightTimeout:
+                        pass
 
             print(f"  Final URL: {page.url}")
 
@@ -289,26 +399,9 @@ def main():
         print(f"\n[Step 5] Current URL: {page.url}")
         print("  Waiting for Style & Publish UI...")
 
-        selectors_to_try = [
-            'text=Brand Intelligence',
-            'text=Brand',
-            'text=Style & Publish',
-            'button:has-text("Next")',
-            'text=Layout Intelligence',
-            'text=Preview',
-        ]
-
-        found_selector = None
-        for sel in selectors_to_try:
-            try:
-                page.wait_for_selector(sel, timeout=5000)
-                found_selector = sel
-                print(f"  Found: {sel}")
-                break
-            except PlaywrightTimeout:
-                continue
-
-        if not found_selector:
+        if wait_visible(any_of(page, STYLE_UI_SELECTORS).first, timeout=15000):
+            print("  Style & Publish UI detected")
+        else:
             print("  WARNING: Style & Publish UI not found")
             screenshot(page, "00-diagnostic.png")
             # Print page content for debugging
@@ -318,7 +411,7 @@ def main():
             except Exception:
                 pass
 
-        page.wait_for_timeout(3000)
+        wait_for_network_idle(page)
 
         # -------------------------------------------------------
         # Step 6: Screenshot Brand step
@@ -330,21 +423,22 @@ def main():
         # Step 7: Navigate to Layout step
         # -------------------------------------------------------
         print("\n[Step 7] Navigating to Layout step...")
-        next_btn = page.locator('button:has-text("Next")').first
+        next_btn = page.get_by_role("button", name="Next").first
+        layout_heading = page.get_by_role("heading", name="Layout Intelligence")
         try:
-            if next_btn.is_visible(timeout=5000):
+            if wait_visible(next_btn, timeout=5000):
+                expect(next_btn).to_be_enabled(timeout=5000)
                 next_btn.click()
-                page.wait_for_timeout(3000)
-                wait_for_network_idle(page)
+                wait_visible(layout_heading, timeout=10000)
                 print("  Clicked Next -- now on Layout step")
             else:
                 raise Exception("Not visible")
         except Exception:
             layout_tab = page.locator('text=Layout').first
             try:
-                if layout_tab.is_visible(timeout=3000):
+                if wait_visible(layout_tab, timeout=3000):
                     layout_tab.click()
-                    page.wait_for_timeout(3000)
+                    wait_visible(layout_heading, timeout=3000)
                     print("  Clicked Layout tab")
                 else:
                     print("  WARNING: No Next button or Layout tab")
@@ -357,21 +451,27 @@ def main():
         # Step 8: Navigate to Preview step
         # -------------------------------------------------------
         print("\n[Step 8] Navigating to Preview step...")
-        next_btn = page.locator('button:has-text("Next")').first
+        next_btn = page.get_by_role("button", name="Next").first
+        # The Preview step shows either the Generate button or an existing render
+        preview_ready = page.get_by_role("button", name=GENERATE_NAME).or_(page.locator("iframe")).first
         try:
-            if next_btn.is_visible(timeout=5000):
+            if wait_visible(next_btn, timeout=5000):
+                expect(next_btn).to_be_enabled(timeout=5000)
                 next_btn.click()
-                page.wait_for_timeout(3000)
-                wait_for_network_idle(page)
+                try:
+                    expect(layout_heading).to_be_hidden(timeout=10000)
+                except AssertionError:
+                    pass
+                wait_visible(preview_ready, timeout=5000)
                 print("  Clicked Next -- now on Preview step")
             else:
                 raise Exception("Not visible")
         except Exception:
             preview_tab = page.locator('text=Preview').first
             try:
-                if preview_tab.is_visible(timeout=3000):
+                if wait_visible(preview_tab, timeout=3000):
                     preview_tab.click()
-                    page.wait_for_timeout(3000)
+                    wait_visible(preview_ready, timeout=3000)
                     print("  Clicked Preview tab")
                 else:
                     print("  WARNING: No Next button or Preview tab")
@@ -384,28 +484,15 @@ def main():
         # Step 9: Click Generate if available
         # -------------------------------------------------------
         print("\n[Step 9] Looking for Generate button...")
-        gen_selectors = [
-            'button:has-text("Generate Preview")',
-            'button:has-text("Generate")',
-            'button:has-text("Render")',
-            'button:has-text("Build Preview")',
-        ]
-
-        gen_btn = None
-        for sel in gen_selectors:
-            try:
-                btn = page.locator(sel).first
-                if btn.is_visible(timeout=3000):
-                    gen_btn = btn
-                    print(f"  Found: {sel}")
-                    break
-            except Exception:
-                continue
+        gen_btn = page.get_by_role("button", name=GENERATE_NAME).first
+        if wait_visible(gen_btn, timeout=3000):
+            print(f"  Found: {gen_btn.inner_text().strip()}")
+        else:
+            gen_btn = None
 
         if gen_btn:
             print("  Clicking Generate...")
             gen_btn.scroll_into_view_if_needed()
-            page.wait_for_timeout(500)
             gen_btn.click(force=True)
 
             print("  Waiting for generation (up to 3 minutes)...")
@@ -413,7 +500,11 @@ def main():
             generation_complete = False
 
             while time.time() - start_time < 180:
-                page.wait_for_timeout(5000)
+                # Returns as soon as an iframe is attached, otherwise after 5s
+                try:
+                    page.locator("iframe").first.wait_for(state="attached", timeout=5000)
+                except PlaywrightTimeout:
+                    pass
                 iframe_count = page.locator("iframe").count()
                 elapsed = int(time.time() - start_time)
                 spinner_count = page.locator('[class*="spinner"], [class*="loading"]').count()
@@ -424,7 +515,8 @@ def main():
 
                 if iframe_count > 0:
                     print("  Generation complete!")
-                    page.wait_for_timeout(5000)
+                    # The iframe is attached before its document renders
+                    wait_for_iframe_content(page, timeout=10000)
                     generation_complete = True
                     break
 
@@ -447,7 +539,8 @@ def main():
         # Step 10: Full-page screenshot of preview output
         # -------------------------------------------------------
         print("\n[Step 10] Capturing preview output...")
-        page.wait_for_timeout(3000)
+        if page.locator("iframe").count() > 0:
+            wait_for_iframe_content(page, timeout=3000)
         screenshot(page, "04-preview-output.png", full_page=True)
 
         # -------------------------------------------------------
@@ -463,16 +556,16 @@ def main():
             for i in range(iframe_count):
                 try:
                     iframe_el = iframe_elements.nth(i)
-                    if not iframe_el.is_visible(timeout=3000):
+                    if not wait_visible(iframe_el, timeout=3000):
                         continue
 
-                    iframe_el.screenshot(path=str(SCREENSHOT_DIR / "05-rendered-content.png"))
+                    iframe_el.screenshot(path=str(SCREENSHOT_DIR / "05-rendered-content.png"), **SCREENSHOT_OPTS)
                     print(f"  Captured iframe {i}")
                     iframe_captured = True
 
                     frame = page.frame_locator(f"iframe >> nth={i}")
                     body = frame.locator("body")
-                    if body.is_visible(timeout=5000):
+                    if wait_visible(body, timeout=5000):
                         body_html = body.inner_html()
                         print(f"  Iframe body: {len(body_html)} chars")
                         html_path = SCREENSHOT_DIR / "rendered-content.html"
@@ -495,7 +588,7 @@ def main():
             try:
                 frame = page.frame_locator("iframe").first
                 body = frame.locator("body")
-                if body.is_visible(timeout=5000):
+                if wait_visible(body, timeout=5000):
                     # Try scrolling on multiple possible scroll containers
                     # The iframe document's scrolling element could be html or body
                     frame_page_scroll = """(el) => {
@@ -510,9 +603,9 @@ def main():
                     }"""
                     result = body.evaluate(frame_page_scroll)
                     print(f"  Scrolled to 1/3: scrollHeight={result.get('scrollHeight', '?')}, scrollTop={result.get('scrollTop', '?')}")
-                    page.wait_for_timeout(1500)
+                    wait_for_images(body)
                     page.locator("iframe").first.screenshot(
-                        path=str(SCREENSHOT_DIR / "06-rendered-scrolled.png"))
+                        path=str(SCREENSHOT_DIR / "06-rendered-scrolled.png"), **SCREENSHOT_OPTS)
                     print("  Captured scrolled content (1/3)")
 
                     frame_page_scroll_2 = """(el) => {
@@ -525,9 +618,9 @@ def main():
                     }"""
                     result2 = body.evaluate(frame_page_scroll_2)
                     print(f"  Scrolled to 2/3: scrollTop={result2.get('scrollTop', '?')}")
-                    page.wait_for_timeout(1500)
+                    wait_for_images(body)
                     page.locator("iframe").first.screenshot(
-                        path=str(SCREENSHOT_DIR / "06b-rendered-scrolled-further.png"))
+                        path=str(SCREENSHOT_DIR / "06b-rendered-scrolled-further.png"), **SCREENSHOT_OPTS)
                     print("  Captured scrolled content (2/3)")
                 else:
                     screenshot(page, "06-rendered-scrolled.png")
@@ -536,7 +629,7 @@ def main():
                 screenshot(page, "06-rendered-scrolled.png")
         else:
             page.evaluate("window.scrollBy(0, window.innerHeight)")
-            page.wait_for_timeout(1500)
+            wait_for_images(page.locator("body"))
             screenshot(page, "06-rendered-scrolled.png")
 
         # -------------------------------------------------------
@@ -544,22 +637,19 @@ def main():
         # -------------------------------------------------------
         print("\n[Step 13] Looking for quality score...")
         quality_found = False
-        for sel in ['text=Brand Match', 'text=Quality', 'text=Brand Alignment', '[class*="quality"]', '[class*="score"]']:
+        quality_el = any_of(page, QUALITY_SELECTORS).first
+        if wait_visible(quality_el, timeout=2000):
             try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=2000):
-                    el.scroll_into_view_if_needed()
-                    page.wait_for_timeout(500)
-                    screenshot(page, "07-quality.png", full_page=False)
-                    quality_found = True
-                    print(f"  Found: {sel}")
-                    break
+                quality_el.scroll_into_view_if_needed()
+                screenshot(page, "07-quality.png")
+                quality_found = True
+                print("  Found quality score section")
             except Exception:
-                continue
+                pass
 
         if not quality_found:
             print("  No quality score found -- viewport screenshot")
-            screenshot(page, "07-quality.png", full_page=False)
+            screenshot(page, "07-quality.png")
 
         # -------------------------------------------------------
         # Summary
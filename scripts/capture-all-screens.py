@@ -25,6 +25,15 @@ def click(page, selector, wait=1):
     except:
         return False
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -34,9 +43,7 @@ def main():
 
         # 1. AUTH
         print("--- AUTH ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
         shot(page, "a01-login", "Login screen")
 
         click(page, 'button:has-text("Sign Up")', 0.5)
@@ -177,9 +184,7 @@ def main():
 
         # 11. SITE ANALYSIS
         print("--- SITE ANALYSIS ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if click(page, 'button:has-text("Open Site Analysis")', 2):
             shot(page, "i01-site-analysis", "Site Analysis V2")
@@ -191,9 +196,7 @@ def main():
 
         # 12. ADMIN
         print("--- ADMIN ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if click(page, 'button:has-text("Admin")', 2):
             shot(page, "j01-admin", "Admin dashboard")
@@ -62,6 +62,15 @@ def click_button(page, selector, wait=1):
         print(f"  Could not click {selector}: {str(e)[:50]}")
     return False
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -76,9 +85,7 @@ def main():
         # ============================================================
         print("\n--- SECTION 1: AUTHENTICATION ---\n")
 
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         shot(page, "auth-login-empty", "Login screen - empty state")
 
@@ -506,9 +513,7 @@ def main():
         # ============================================================
         print("\n--- SECTION 23: SITE ANALYSIS ---\n")
 
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if click_button(page, 'button:has-text("Open Site Analysis")', 2):
             shot(page, "site-analysis-main", "Site Analysis V2 - main view")
@@ -48,6 +48,15 @@ def close_modal(page):
     except:
         pass
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     ensure_dir(SCREENSHOT_DIR)
 
@@ -63,9 +72,7 @@ def main():
         # ========================================
         print("\n--- 1. AUTHENTICATION ---")
 
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         # Login screen
         take_screenshot(page, "auth-01-login", "Login screen with Sign In tab active")
@@ -262,9 +269,7 @@ def main():
         print("\n--- 11. SITE ANALYSIS ---")
 
         # Go back to project selection
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if safe_click(page, 'button:has-text("Open Site Analysis")'):
             page.wait_for_load_state('networkidle')
@@ -283,9 +288,7 @@ def main():
         # ========================================
         print("\n--- 12. ADMIN ---")
 
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if safe_click(page, 'button:has-text("Admin Dashboard"), button:has-text("Admin")'):
             page.wait_for_load_state('networkidle')
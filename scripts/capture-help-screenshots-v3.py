@@ -39,6 +39,15 @@ def close_modal(page):
     page.keyboard.press('Escape')
     time.sleep(0.3)
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     ensure_dir(SCREENSHOT_DIR)
 
@@ -50,9 +59,7 @@ def main():
 
         # ========== LOGIN ==========
         print("--- LOGIN ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         screenshot(page, "01-auth-login", "Login screen")
 
@@ -149,9 +156,7 @@ def main():
 
         # ========== SITE ANALYSIS ==========
         print("--- SITE ANALYSIS ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if click_if_visible(page, 'button:has-text("Open Site Analysis")'):
             time.sleep(2)
@@ -165,9 +170,7 @@ def main():
 
         # ========== ADMIN ==========
         print("--- ADMIN ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         if click_if_visible(page, 'button:has-text("Admin")'):
             time.sleep(2)
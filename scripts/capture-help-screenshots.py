@@ -32,6 +32,15 @@ def wait_and_click(page, selector, timeout=5000):
     except:
         return False
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     ensure_dir(SCREENSHOT_DIR)
 
@@ -44,9 +53,7 @@ def main():
 
         # 1. Login Screen
         print("\n--- Authentication Screens ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
         take_screenshot(page, "01-login-screen", "Login screen with email and password fields")
 
         # Check if we're on login screen
@@ -190,9 +197,7 @@ def main():
 
         # 8. Site Analysis
         print("\n--- Site Analysis ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         site_analysis_btn = page.locator('button:has-text("Site Analysis"), button:has-text("Open Site Analysis")')
         if site_analysis_btn.count() > 0:
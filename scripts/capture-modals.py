@@ -34,6 +34,15 @@ def close_modal(page):
     page.keyboard.press('Escape')
     time.sleep(0.3)
 
+def open_home(page):
+    """Load the app root and wait for the login form or project list to render."""
+    page.goto(BASE_URL, wait_until='domcontentloaded')
+    try:
+        page.wait_for_selector('input[type="email"], table tbody tr', timeout=10000)
+    except Exception:
+        pass
+    page.evaluate('document.fonts.ready.then(() => true)')
+
 def main():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -43,9 +52,7 @@ def main():
 
         # 1. LOGIN
         print("--- Logging in ---")
-        page.goto(BASE_URL)
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        open_home(page)
 
         page.fill('input[type="email"]', EMAIL)
         page.fill('input[type="password"]', PASSWORD)
@@ -5,7 +5,7 @@ Initial reconnaissance script to map the application UI and discover all functio
 import os
 import json
 from datetime import datetime
-from playwright.sync_api import sync_playwright, expect
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeout
 from test_config import *
 
 def ensure_screenshot_dir():
@@ -14,16 +14,19 @@ def ensure_screenshot_dir():
 def login(page):
     """Log into the application"""
     print(f"[1] Navigating to {BASE_URL}...")
-    page.goto(BASE_URL)
-    page.wait_for_load_state('networkidle')
-    page.wait_for_timeout(2000)
+    page.goto(BASE_URL, wait_until="domcontentloaded")
+    # Ready once either the login form or the project list renders
+    try:
+        page.locator(f"{LOGIN_FORM_SELECTOR}, {PROJECT_ROW_SELECTOR}").first.wait_for(timeout=PAGE_LOAD_TIMEOUT)
+    except PlaywrightTimeout:
+        pass
 
     # Take screenshot of login page
     page.screenshot(path=f"{SCREENSHOT_DIR}/01_login_page.png", full_page=True)
     print("    Screenshot: 01_login_page.png")
 
     # Check if we're on login page
-    if "Sign in" in page.content() or "Email Address" in page.content():
+    if page.locator(LOGIN_FORM_SELECTOR).is_visible():
         print(f"[2] Found login form, entering credentials...")
 
         # Wait for and fill email
@@ -45,12 +48,12 @@ def login(page):
         print(f"    Clicking Sign In button...")
         sign_in_btn.click()
 
-        # Wait for navigation/loading
+        # Wait for the project list to render after auth
         print(f"    Waiting for login to complete...")
-        page.wait_for_timeout(5000)  # Wait for auth
-
-        # Check if login succeeded by looking for dashboard elements
-        page.wait_for_load_state('networkidle')
+        try:
+            page.locator(PROJECT_ROW_SELECTOR).first.wait_for(timeout=PAGE_LOAD_TIMEOUT)
+        except PlaywrightTimeout:
+            pass
 
         page.screenshot(path=f"{SCREENSHOT_DIR}/03_after_login.png", full_page=True)
         print("    Screenshot: 03_after_login.png")
@@ -59,8 +62,8 @@ def login(page):
         current_url = page.url
         print(f"    Current URL: {current_url}")
 
-        # Check for project selector or dashboard elements
-        if "Sign in" not in page.content() or page.locator('text="Select Project"').is_visible():
+        # Check for the project list
+        if not page.locator(LOGIN_FORM_SELECTOR).is_visible() or page.locator(PROJECT_ROW_SELECTOR).first.is_visible():
             print("    Login appears successful!")
             return True
         else:
@@ -68,7 +71,7 @@ def login(page):
             # Try waiting longer
             page.wait_for_timeout(3000)
             page.screenshot(path=f"{SCREENSHOT_DIR}/03b_after_wait.png", full_page=True)
-            return "Sign in" not in page.content()
+            return not page.locator(LOGIN_FORM_SELECTOR).is_visible()
     else:
         print("    Already logged in or different page structure")
         return True
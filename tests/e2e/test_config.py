@@ -18,6 +18,11 @@ TEST_PROJECT = "daadvracht"
 TEST_LANGUAGE = "Dutch"
 TEST_REGION = "Netherlands"
 
+# Login form probe (cheaper than scanning page.content() for "Sign in")
+LOGIN_FORM_SELECTOR = 'input[type="email"]'
+# A row in the /projects table; rendered once the logged-in project list has loaded
+PROJECT_ROW_SELECTOR = 'table tbody tr'
+
 # Screenshot directory
 SCREENSHOT_DIR = "D:/www/cost-of-retreival-reducer/tests/e2e/screenshots"
 